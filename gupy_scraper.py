@@ -6,19 +6,152 @@ Coleta: link, nome, empresa, remoto, tipoContrato, datas.
 """
 
 import json
+import logging
 import re
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import chain
+from queue import Queue
+from typing import List, Dict, Optional, Callable, ContextManager, Tuple
 from urllib.parse import urljoin, quote
 
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+try:
+    # opcional: leitura/escrita de JSON mais rápida
+    import orjson
+    _USE_ORJSON = True
+except ImportError:
+    _USE_ORJSON = False
+
+try:
+    # opcional: regex em tempo linear (google-re2) para as buscas feitas em todo card
+    import re2 as fast_re
+    _USE_RE2 = True
+except ImportError:
+    fast_re = re
+    _USE_RE2 = False
+
+try:
+    # opcional: busca direta por HTTP quando a página vem renderizada do servidor
+    import httpx
+    _USE_HTTPX = True
+except ImportError:
+    _USE_HTTPX = False
+
+logger = logging.getLogger(__name__)
+
+
+BASE_URL = 'https://portal.gupy.io'
+SEARCH_URL_TMPL = BASE_URL + '/job-search/term={term}{remote}'
+REMOTE_SUFFIX = '&workplaceTypes[]=remote'
+
+# Só âncoras com href não vazio: cards sem link são descartados já na seleção
+CARD_SELECTOR = 'a[aria-label^="Ir para vaga"][href]:not([href=""])'
+NEXT_PAGE_SELECTOR = 'nav[aria-label="pagination navigation"] button[aria-label="Próxima página"]:not([disabled])'
+# Mesmo predicado de CARD_SELECTOR, compilado uma vez para o parse do page_source
+CARD_XPATH = etree.XPath('//a[starts-with(@aria-label, "Ir para vaga") and @href != ""]')
+# Marcador de cards no HTML inicial: presente quando a busca vem renderizada do servidor
+SSR_CARD_MARKER = 'aria-label="Ir para vaga'
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+}
+# Teto de workers por fonte em scrape_keywords: cada worker é um Chrome e uma requisição HTTP por vez ao mesmo site
+MAX_WORKERS_PER_SOURCE = 3
+
+# Uma única alternação com grupos nomeados: uma busca no texto combinado dos
+# detalhes classifica o contrato; o grupo que casou (match.lastgroup) indexa CONTRACT_CANON.
+CONTRACT_RE = fast_re.compile(
+    r'(?i)(?P<efetivo>efetivo)|(?P<temporario>tempor)|(?P<estagio>est[aá]g)|(?P<aprendiz>aprendiz)|(?P<pj>pj|p\.?j\.?)'
+)
+CONTRACT_CANON = {
+    'efetivo': 'Efetivo', 'temporario': 'Temporário', 'estagio': 'Estágio', 'aprendiz': 'Aprendiz', 'pj': 'PJ',
+}
+ARIA_TIPO_RE = fast_re.compile(r'(?i)tipo\s+([^.]+)\.')
+# No RE2, \w é só ASCII: \pL mantém "março" inteiro para o _parse_date
+_WORD = r'\pL+' if _USE_RE2 else r'\w+'
+# Detecta um texto com cara de data (para escolher qual detalhe passar a _parse_date)
+DATE_RE = fast_re.compile(
+    rf'(\d{{1,2}}[/\-]\d{{1,2}}[/\-]\d{{2,4}}|\d{{1,2}}\s+de\s+{_WORD}\s+de\s+\d{{4}}|\d{{1,2}}\s+de\s+{_WORD})'
+)
+DATE_CLASS_RE = re.compile(r'date|time|published', re.IGNORECASE)
+# Formatos aceitos por _parse_date, em ordem de prioridade
+DATE_PATTERNS = (
+    re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'),  # DD/MM/YYYY
+    re.compile(r'(\d{1,2}) de (\w+) de (\d{4})'),  # DD de Mês de YYYY
+    re.compile(r'(\d{1,2}) de (\w+)'),  # DD de Mês (ano atual)
+    re.compile(r'(\d{1,2})/(\d{1,2})'),  # DD/MM (ano atual)
+)
+# Quais formatos tentar, pela presença de '/' e de ' de ' no texto (ordem original mantida)
+DATE_PATTERN_DISPATCH = {
+    (True, True): (0, 1, 2, 3),
+    (True, False): (0, 3),
+    (False, True): (1, 2),
+    (False, False): (),
+}
+MONTHS_PT = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
+    'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
+    'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
+}
+
+# Extrai os campos de todos os cards da página numa única chamada ao navegador.
+# Mesmo formato de GupyScraper._card_from_element (fallback via page_source).
+CARDS_JS = """
+const text = el => el ? el.textContent.trim() : null;
+return Array.from(document.querySelectorAll(arguments[0])).map(a => ({
+  href: a.getAttribute('href'),
+  aria: a.getAttribute('aria-label'),
+  h3: text(a.querySelector('h3')),
+  p: text(a.querySelector('p')),
+  spans: Array.from(a.querySelectorAll('span')).map(s => s.textContent.trim()).filter(Boolean),
+  dates: Array.from(a.querySelectorAll('time, span'))
+    .filter(e => /date|time|published/i.test(e.getAttribute('class') || ''))
+    .map(e => e.textContent.trim()),
+}));
+"""
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_cached(date_str: str, current_year: int) -> Optional[datetime]:
+    """
+    Converte string de data para datetime. Memoizado: poucas strings de data
+    distintas se repetem entre os cards. O ano corrente entra na chave do cache
+    para que datas sem ano não fiquem presas ao ano da primeira chamada.
+    """
+    date_lower = date_str.lower()
+    for index in DATE_PATTERN_DISPATCH['/' in date_lower, ' de ' in date_lower]:
+        match = DATE_PATTERNS[index].search(date_lower)
+        if match:
+            groups = match.groups()
+            try:
+                if len(groups) == 3:
+                    if index == 0:
+                        day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
+                    else:
+                        day, month, year = int(groups[0]), MONTHS_PT[groups[1]], int(groups[2])
+                elif len(groups) == 2:
+                    if index == 2:
+                        day, month = int(groups[0]), MONTHS_PT[groups[1]]
+                    else:
+                        day, month = int(groups[0]), int(groups[1])
+                    year = current_year
+                return datetime(year, month, day)
+            except (ValueError, KeyError):
+                continue
+    return None
 
 
 class GupyScraper:
@@ -28,11 +161,38 @@ class GupyScraper:
         self.chromedriver_path = chromedriver_path
         self.headless = headless
         self.driver = None
-        self.base_url = 'https://portal.gupy.io'
+        self.base_url = BASE_URL
+        # Paginação direto pela URL (&page=N); desligada se o portal ignorar o parâmetro
+        self.url_pagination = True
+        # None = ainda não testado; False = HTML do servidor sem cards (usa Selenium)
+        self.ssr_available: Optional[bool] = None if _USE_HTTPX else False
+        self.keep_driver = False
+
+    def open(self) -> 'GupyScraper':
+        """
+        Mantém o Chrome aberto entre as chamadas de scrape_jobs, até close(). O
+        navegador só é criado na primeira vez que o caminho Selenium for necessário.
+        """
+        self.keep_driver = True
+        return self
+
+    def close(self) -> None:
+        self.keep_driver = False
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def __enter__(self) -> 'GupyScraper':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
     
     def _setup_driver(self) -> webdriver.Chrome:
         """Configura e inicializa o Chrome WebDriver."""
         chrome_options = Options()
+        # driver.get() retorna no DOMContentLoaded; a espera pelos cards é explícita
+        chrome_options.page_load_strategy = 'eager'
         if self.headless:
             chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
@@ -40,130 +200,119 @@ class GupyScraper:
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--lang=pt-BR')
         chrome_options.add_argument('--accept-lang=pt-BR,pt;q=0.9,en;q=0.8')
-        
+        # Só lemos texto dos cards: não baixa imagens/CSS nem roda serviços de fundo
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-translate')
+        chrome_options.add_argument('--mute-audio')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--disable-notifications')
+        chrome_options.add_argument('--metrics-recording-only')
+        chrome_options.add_argument('--no-first-run')
+        chrome_options.add_argument('--disable-features=Translate,BackForwardCache')
+        # Cache em disco explícito: JS/CSS do portal reaproveitados entre keywords
+        chrome_options.add_argument('--disk-cache-size=104857600')
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+
         service = Service(self.chromedriver_path)
+        # Sem implicitly_wait: toda espera é explícita (WebDriverWait), e um
+        # find_element sem resultado falha na hora em vez de travar 10s
         driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.implicitly_wait(10)
         
         return driver
 
+    def _goto_page(self, wait: WebDriverWait, search_url: str, page: int, previous_first_href: Optional[str]) -> None:
+        """
+        Vai para a página `page` da busca. Navega direto pela URL (&page=N); se o
+        portal devolver os mesmos cards da página anterior, o parâmetro foi ignorado
+        e a navegação volta a ser pelo botão 'Próxima página'.
+        """
+        if self.url_pagination:
+            self.driver.get(f'{search_url}&page={page}')
+            wait.until(lambda driver: driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR))
+            first_href = self.driver.find_element(By.CSS_SELECTOR, CARD_SELECTOR).get_dom_attribute('href')
+            if first_href != previous_first_href:
+                return
+            print("⚠️ Parâmetro &page ignorado pelo portal - usando o botão 'Próxima página'")
+            self.url_pagination = False
+
+        next_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)))
+        old_first_card = self.driver.find_element(By.CSS_SELECTOR, CARD_SELECTOR)
+        self.driver.execute_script("arguments[0].click();", next_button)
+        # Espera a lista antiga sair do DOM e a nova aparecer (sem sleeps fixos)
+        wait.until(EC.staleness_of(old_first_card))
+        wait.until(lambda driver: driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR))
+
     @staticmethod
     def _parse_date(date_str: str) -> Optional[datetime]:
         """Converte string de data para datetime"""
         if not date_str:
             return None
-            
-        patterns = [
-            r'(\d{1,2})/(\d{1,2})/(\d{4})',  # DD/MM/YYYY
-            r'(\d{1,2}) de (\w+) de (\d{4})',  # DD de Mês de YYYY
-            r'(\d{1,2}) de (\w+)',  # DD de Mês (ano atual)
-            r'(\d{1,2})/(\d{1,2})',  # DD/MM (ano atual)
-        ]
-        
-        current_year = datetime.now().year
-        months_pt = {
-            'janeiro': 1, 'fevereiro': 2, 'março': 3, 'abril': 4,
-            'maio': 5, 'junho': 6, 'julho': 7, 'agosto': 8,
-            'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12
-        }
-        
-        for pattern in patterns:
-            match = re.search(pattern, date_str.lower())
-            if match:
-                groups = match.groups()
-                try:
-                    if len(groups) == 3:
-                        if pattern == patterns[0]:
-                            day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                        else:
-                            day, month, year = int(groups[0]), months_pt[groups[1]], int(groups[2])
-                    elif len(groups) == 2:
-                        if pattern == patterns[2]:
-                            day, month = int(groups[0]), months_pt[groups[1]]
-                        else:
-                            day, month = int(groups[0]), int(groups[1])
-                        year = current_year
-                    return datetime(year, month, day)
-                except (ValueError, KeyError):
-                    continue
-        return None
+        return _parse_date_cached(date_str, datetime.now().year)
 
     @staticmethod
-    def _extract_job_info(job_card_html: str, base_url: str) -> Optional[Dict]:
-        """Extrai informações de uma vaga a partir do HTML do card"""
-        soup = BeautifulSoup(job_card_html, 'html.parser')
-
-        link_element = soup.find('a', {'aria-label': lambda x: x and x.startswith('Ir para vaga')})
-        if not link_element:
-            return None
+    def _card_from_element(link_element) -> Dict:
+        """Lê os campos brutos do card a partir do elemento <a> (lxml), no formato de CARDS_JS"""
+        title_element = link_element.find('.//h3')
+        company_element = link_element.find('.//p')
+        detail_spans = link_element.iter('span')
+        date_elements = (elem for elem in link_element.iter('time', 'span')
+                         if DATE_CLASS_RE.search(elem.get('class', '')))
+        return {
+            'href': link_element.get('href'),
+            'aria': link_element.get('aria-label'),
+            'h3': title_element.text_content().strip() if title_element is not None else None,
+            'p': company_element.text_content().strip() if company_element is not None else None,
+            'spans': [text for span in detail_spans if (text := span.text_content().strip())],
+            'dates': [elem.text_content().strip() for elem in date_elements],
+        }
 
-        href = link_element.get('href', '')
+    @staticmethod
+    def _extract_job_info(card: Dict, base_url: str) -> Optional[Dict]:
+        """Extrai informações de uma vaga a partir dos campos brutos do card (ver CARDS_JS)"""
+        href = card.get('href') or ''
         if not href:
             return None
 
-        link = href if href.startswith('http') else urljoin(base_url, href)
+        if href.startswith('http'):
+            link = href
+        elif href.startswith('/') and not href.startswith('//'):
+            # Caminho absoluto: concatenação simples, sem o parse completo do urljoin
+            link = base_url.rstrip('/') + href
+        else:
+            link = urljoin(base_url, href)
 
-        title_element = link_element.find('h3')
-        nome = title_element.get_text(strip=True) if title_element else None
-
-        company_element = link_element.find('p')
-        empresa = company_element.get_text(strip=True) if company_element else None
-
-        detail_spans = link_element.find_all('span')
-        detail_texts = [span.get_text(strip=True) for span in detail_spans if span.get_text(strip=True)]
+        nome = card.get('h3')
+        empresa = card.get('p')
+        detail_texts = card.get('spans') or []
 
+        # Texto combinado em minúsculas, calculado uma única vez por card
         detail_text_combined = ' '.join(detail_texts).lower()
         remoto = 'remoto' in detail_text_combined or 'home office' in detail_text_combined
 
-        tipo_contrato = None
-        contract_patterns = [
-            r'efetivo', r'tempor[aá]rio', r'est[aá]gio', r'aprendiz', r'pj|p\.?j\.?' 
-        ]
-        for detail in detail_texts:
-            for pattern in contract_patterns:
-                if re.search(pattern, detail.lower()):
-                    tipo_contrato = detail
-                    break
-            if tipo_contrato:
-                break
+        match = CONTRACT_RE.search(detail_text_combined)
+        tipo_contrato = CONTRACT_CANON[match.lastgroup] if match else None
 
+        aria_label = card.get('aria') or ''
         if not tipo_contrato:
-            aria_label = link_element.get('aria-label', '')
-            match = re.search(r'tipo\s+([^.]+)\.', aria_label, re.IGNORECASE)
-            if match:
-                tipo_contrato = match.group(1).strip()
-
-        if tipo_contrato:
-            tipo_lower = tipo_contrato.lower()
-            if 'efetivo' in tipo_lower:
-                tipo_contrato = 'Efetivo'
-            elif 'tempor' in tipo_lower:
-                tipo_contrato = 'Temporário'
-            elif 'estág' in tipo_lower or 'estag' in tipo_lower:
-                tipo_contrato = 'Estágio'
-            elif 'aprendiz' in tipo_lower:
-                tipo_contrato = 'Aprendiz'
-            elif 'pj' in tipo_lower:
-                tipo_contrato = 'PJ'
-            else:
-                tipo_contrato = tipo_contrato.strip()
+            aria_match = ARIA_TIPO_RE.search(aria_label)
+            if aria_match:
+                tipo_raw = aria_match.group(1).strip()
+                match = CONTRACT_RE.search(tipo_raw)
+                tipo_contrato = CONTRACT_CANON[match.lastgroup] if match else tipo_raw
 
         data_publicacao = None
-        data_str = None
-        for detail in detail_texts:
-            if re.search(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{1,2}\s+de\s+\w+\s+de\s+\d{4}|\d{1,2}\s+de\s+\w+', detail):
-                data_str = detail
-                break
-        if not data_str:
-            date_elements = link_element.find_all(['time', 'span'], class_=re.compile(r'date|time|published', re.I))
-            for elem in date_elements:
-                text = elem.get_text(strip=True)
-                if re.search(r'\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{1,2}\s+de\s+\w+\s+de\s+\d{4}|\d{1,2}\s+de\s+\w+', text):
-                    data_str = text
-                    break
+        # Detalhes e depois elementos de data, numa única passada preguiçosa
+        data_str = next((text for text in chain(detail_texts, card.get('dates') or ()) if DATE_RE.search(text)), None)
         if not data_str:
-            aria_label = link_element.get('aria-label', '')
-            date_match = re.search(r'(\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}|\d{1,2}\s+de\s+\w+\s+de\s+\d{4}|\d{1,2}\s+de\s+\w+)', aria_label)
+            date_match = DATE_RE.search(aria_label)
             if date_match:
                 data_str = date_match.group(1)
         if data_str:
@@ -176,101 +325,192 @@ class GupyScraper:
             'remoto': remoto,
             'tipoContrato': tipo_contrato,
             'dataPublicacao': data_publicacao.isoformat() if data_publicacao else None,
-            'dataPublicacaoStr': data_str
+            'dataPublicacaoStr': data_str,
+            # Uso interno (comparação com a data de corte); removido antes de salvar
+            '_date_dt': data_publicacao,
         }
 
-    def scrape_jobs(self, term: str = 'vagas', remote_only: bool = True, max_pages: int = 10, max_days_old: int = 3) -> List[Dict]:
+    def _scrape_ssr(self, search_url: str, max_pages: int, cutoff_date: datetime, max_days_old: int,
+                    stop_on_first_old: bool) -> Optional[Tuple[List[Dict], bool]]:
         """
-        Faz scraping de vagas na Gupy com paginação e parada por data.
+        Busca as páginas por HTTP, sem navegador, quando o portal entrega os cards
+        no HTML inicial. Uma página por vez, no mesmo pool de conexões: para na
+        primeira página vazia, repetida ou com vaga antiga, sem baixar as seguintes.
+        Retorna None (sem SSR, bloqueio ou erro) para refazer a busca pelo Selenium.
         """
-        self.driver = self._setup_driver()
+        if self.ssr_available is False:
+            return None
+        all_jobs: List[Dict] = []
+        found_old_job = False
+        previous_first_href = None
         try:
-            search_url = f'{self.base_url}/job-search/term={quote(term)}'
-            if remote_only:
-                search_url += '&workplaceTypes[]=remote'
-            print(f"Acessando: {search_url}")
-            self.driver.get(search_url)
-            wait = WebDriverWait(self.driver, 10)
+            with httpx.Client(headers=HTTP_HEADERS, timeout=15, follow_redirects=True) as client:
+                for current_page in range(1, max_pages + 1):
+                    url = search_url if current_page == 1 else f'{search_url}&page={current_page}'
+                    response = client.get(url)
+                    if current_page == 1:
+                        self.ssr_available = response.status_code == 200 and SSR_CARD_MARKER in response.text
+                        if not self.ssr_available:
+                            return None
+                    elif response.status_code != 200:
+                        # Bloqueio no meio da paginação: refaz a busca inteira pelo navegador
+                        print(f"⚠️ HTTP {response.status_code} na página {current_page}; usando o navegador")
+                        self.ssr_available = False
+                        return None
+                    job_cards = [self._card_from_element(a) for a in CARD_XPATH(lxml_html.fromstring(response.text))]
+                    # Página vazia ou repetida (parâmetro &page ignorado): acabou a paginação
+                    if not job_cards or job_cards[0].get('href') == previous_first_href:
+                        break
+                    previous_first_href = job_cards[0].get('href')
+                    print(f"Processando página {current_page} (HTTP)...")
+                    page_jobs, found_old_job = self._collect_page_jobs(job_cards, cutoff_date, max_days_old,
+                                                                       stop_on_first_old)
+                    all_jobs.extend(page_jobs)
+                    print(f"Coletadas {len(page_jobs)} vagas recentes da página {current_page}")
+                    if found_old_job:
+                        print(f"🛑 Página {current_page} contém vagas antigas - não avançará para próxima página")
+                        break
+        except httpx.HTTPError as e:
+            print(f"⚠️ Falha na busca por HTTP ({e}); usando o navegador")
+            return None
+        return all_jobs, found_old_job
+
+    def _collect_page_jobs(self, job_cards: List[Dict], cutoff_date: datetime, max_days_old: int,
+                           stop_on_first_old: bool) -> Tuple[List[Dict], bool]:
+        """
+        Filtra os cards de uma página; retorna as vagas salvas e se havia vaga antiga.
+        Cada card só gera log em DEBUG; em INFO sai um resumo por página.
+        """
+        page_jobs = []
+        has_old_job_on_page = False
+        senior_count = old_count = undated_count = 0
+        for card in job_cards:
             try:
-                wait.until(
-                    lambda driver: driver.find_elements(By.CSS_SELECTOR, 'a[aria-label^="Ir para vaga"]') or
-                                  driver.find_elements(By.CSS_SELECTOR, 'nav[aria-label="pagination navigation"]')
-                )
-            except TimeoutException:
-                print("Timeout aguardando elementos da página")
-                return []
-            all_jobs = []
-            current_page = 1
-            cutoff_date = datetime.now() - timedelta(days=max_days_old)
-            found_old_job = False
-            while current_page <= max_pages and not found_old_job:
-                print(f"Processando página {current_page}...")
-                time.sleep(1.2)
-                job_cards = self.driver.find_elements(By.CSS_SELECTOR, 'a[aria-label^="Ir para vaga"]')
-                if not job_cards:
-                    print("Nenhuma vaga encontrada nesta página")
-                    break
-                page_jobs = []
-                has_old_job_on_page = False
-                for card in job_cards:
-                    try:
-                        job_info = self._extract_job_info(card.get_attribute('outerHTML'), self.base_url)
-                        if job_info and job_info['link']:
-                            # Filtro: excluir vagas Senior/SR
-                            nome = (job_info.get('nome') or '').lower()
-                            if 'senior' in nome or 'sr' in nome:
-                                print(f"🚫 Vaga Senior/SR filtrada: {job_info.get('nome', 'N/A')}")
-                                continue
-                            
-                            if job_info['dataPublicacao']:
-                                job_date = datetime.fromisoformat(job_info['dataPublicacao'])
-                                if job_date < cutoff_date:
-                                    print(f"⚠️ Vaga antiga encontrada: {job_info['nome'][:50]}... - {job_info['dataPublicacaoStr']} (> {max_days_old} dias) - IGNORADA")
-                                    has_old_job_on_page = True
-                                    continue
-                                else:
-                                    print(f"✅ Vaga recente: {job_info['nome'][:50]}... - {job_info['dataPublicacaoStr']} - SALVA")
-                                    page_jobs.append(job_info)
-                            else:
-                                print(f"📅 Vaga sem data: {job_info['nome'][:50]}... - SALVA (assumindo recente)")
-                                page_jobs.append(job_info)
-                    except Exception as e:
-                        print(f"Erro ao processar card de vaga: {e}")
+                job_info = self._extract_job_info(card, self.base_url)
+                if job_info and job_info['link']:
+                    # Card sem título (sem <h3>) não é vaga válida: descartado explicitamente
+                    if not job_info.get('nome'):
+                        continue
+                    job_date = job_info.pop('_date_dt', None)
+                    # Filtro: excluir vagas Senior/SR
+                    nome = (job_info.get('nome') or '').lower()
+                    if 'senior' in nome or 'sr' in nome:
+                        senior_count += 1
+                        logger.debug("🚫 Vaga Senior/SR filtrada: %s", job_info.get('nome', 'N/A'))
                         continue
-                if has_old_job_on_page:
-                    print(f"🛑 Página {current_page} contém vagas antigas - não avançará para próxima página")
-                    found_old_job = True
-                all_jobs.extend(page_jobs)
-                print(f"Coletadas {len(page_jobs)} vagas recentes da página {current_page}")
-                if found_old_job:
-                    break
-                try:
-                    next_button = self.driver.find_element(
-                        By.CSS_SELECTOR, 'nav[aria-label="pagination navigation"] button[aria-label="Próxima página"]:not([disabled])'
-                    )
-                    self.driver.execute_script("arguments[0].click();", next_button)
-                    time.sleep(1)
-                    current_page += 1
-                except NoSuchElementException:
-                    print("Botão 'Próxima página' não encontrado ou desabilitado")
-                    break
-                except Exception as e:
-                    print(f"Erro ao navegar para próxima página: {e}")
-                    break
+                    
+                    if job_date:
+                        if job_date < cutoff_date:
+                            old_count += 1
+                            logger.debug("⚠️ Vaga antiga encontrada: %.50s... - %s (> %s dias) - IGNORADA",
+                                         job_info['nome'], job_info['dataPublicacaoStr'], max_days_old)
+                            has_old_job_on_page = True
+                            if stop_on_first_old:
+                                break
+                            continue
+                        else:
+                            logger.debug("✅ Vaga recente: %.50s... - %s - SALVA", job_info['nome'], job_info['dataPublicacaoStr'])
+                            page_jobs.append(job_info)
+                    else:
+                        undated_count += 1
+                        logger.debug("📅 Vaga sem data: %.50s... - SALVA (assumindo recente)", job_info['nome'])
+                        page_jobs.append(job_info)
+            except Exception as e:
+                logger.warning("Erro ao processar card de vaga: %s", e)
+                continue
+        logger.info("   • %d salvas (%d sem data), %d antigas e %d Senior/SR ignoradas",
+                    len(page_jobs), undated_count, old_count, senior_count)
+        return page_jobs, has_old_job_on_page
+
+    def _scrape_with_browser(self, search_url: str, max_pages: int, cutoff_date: datetime, max_days_old: int,
+                             stop_on_first_old: bool) -> Tuple[List[Dict], bool]:
+        """Caminho Selenium: renderiza a busca no Chrome e pagina até a data de corte."""
+        if self.driver is None:
+            self.driver = self._setup_driver()
+        self.driver.get(search_url)
+        wait = WebDriverWait(self.driver, 10)
+        try:
+            wait.until(
+                lambda driver: driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR) or
+                              driver.find_elements(By.CSS_SELECTOR, 'nav[aria-label="pagination navigation"]')
+            )
+        except TimeoutException:
+            print("Timeout aguardando elementos da página")
+            return [], False
+        all_jobs = []
+        current_page = 1
+        found_old_job = False
+        while current_page <= max_pages and not found_old_job:
+            print(f"Processando página {current_page}...")
+            # Todos os cards da página numa única chamada ao navegador
+            try:
+                job_cards = self.driver.execute_script(CARDS_JS, CARD_SELECTOR) or []
+            except WebDriverException:
+                page_root = lxml_html.fromstring(self.driver.page_source)
+                job_cards = [self._card_from_element(a) for a in CARD_XPATH(page_root)]
+            if not job_cards:
+                print("Nenhuma vaga encontrada nesta página")
+                break
+            page_jobs, has_old_job_on_page = self._collect_page_jobs(job_cards, cutoff_date, max_days_old,
+                                                                     stop_on_first_old)
+            if has_old_job_on_page:
+                print(f"🛑 Página {current_page} contém vagas antigas - não avançará para próxima página")
+                found_old_job = True
+            all_jobs.extend(page_jobs)
+            print(f"Coletadas {len(page_jobs)} vagas recentes da página {current_page}")
+            if found_old_job:
+                break
+            try:
+                # Sem botão 'Próxima página' habilitado, esta é a última página
+                self.driver.find_element(By.CSS_SELECTOR, NEXT_PAGE_SELECTOR)
+                self._goto_page(wait, search_url, current_page + 1, job_cards[0].get('href'))
+                current_page += 1
+            except NoSuchElementException:
+                print("Botão 'Próxima página' não encontrado ou desabilitado")
+                break
+            except TimeoutException:
+                print("Timeout aguardando carregamento da próxima página")
+                break
+            except Exception as e:
+                print(f"Erro ao navegar para próxima página: {e}")
+                break
+        return all_jobs, found_old_job
+
+    def scrape_jobs(self, term: str = 'vagas', remote_only: bool = True, max_pages: int = 10, max_days_old: int = 3,
+                    stop_on_first_old: bool = True) -> List[Dict]:
+        """
+        Faz scraping de vagas na Gupy com paginação e parada por data.
+        Com stop_on_first_old=True (resultados em ordem cronológica), os cards
+        restantes da página são ignorados assim que a primeira vaga antiga aparece.
+        Se a busca vier renderizada do servidor, as páginas são lidas por HTTP e o
+        Chrome nem é aberto. Sem open() (ou bloco `with`), o Chrome usado é fechado ao final.
+        """
+        search_url = SEARCH_URL_TMPL.format(term=quote(term), remote=REMOTE_SUFFIX if remote_only else '')
+        print(f"Acessando: {search_url}")
+        cutoff_date = datetime.now() - timedelta(days=max_days_old)
+        try:
+            ssr_result = self._scrape_ssr(search_url, max_pages, cutoff_date, max_days_old, stop_on_first_old)
+            if ssr_result is not None:
+                all_jobs, found_old_job = ssr_result
+            else:
+                all_jobs, found_old_job = self._scrape_with_browser(search_url, max_pages, cutoff_date,
+                                                                    max_days_old, stop_on_first_old)
             if found_old_job:
                 print(f"🛑 Busca interrompida para '{term}' - vaga mais antiga que {max_days_old} dias encontrada")
             else:
                 print(f"✅ Busca finalizada para '{term}' - {len(all_jobs)} vagas coletadas")
             return all_jobs
         finally:
-            if self.driver:
+            if not self.keep_driver and self.driver:
                 self.driver.quit()
+                self.driver = None
 
 
 def load_keywords(filename: str = 'keywords.json') -> List[str]:
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            keywords = json.load(f)
+        with open(filename, 'rb') as f:
+            raw = f.read()
+        keywords = orjson.loads(raw) if _USE_ORJSON else json.loads(raw)
         return keywords if isinstance(keywords, list) else []
     except FileNotFoundError:
         print(f"⚠️ Arquivo {filename} não encontrado. Usando keyword padrão 'vagas'")
@@ -280,31 +520,80 @@ def load_keywords(filename: str = 'keywords.json') -> List[str]:
         return ['vagas']
 
 
+def write_json(filename: str, data) -> None:
+    """Grava JSON indentado em UTF-8 (acentos sem escape), via orjson quando disponível."""
+    if _USE_ORJSON:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def deduplicate_jobs(jobs: List[Dict]) -> List[Dict]:
-    seen = set()
-    unique_jobs = []
+    # dict preserva a ordem de inserção: fica a primeira ocorrência de cada chave
+    unique_jobs: Dict[str, Dict] = {}
     for job in jobs:
         key = job.get('link') or job.get('jobId')
-        if not key:
-            continue
-        if key not in seen:
-            seen.add(key)
-            unique_jobs.append(job)
-    return unique_jobs
+        if key:
+            unique_jobs.setdefault(key, job)
+    return list(unique_jobs.values())
+
+
+def scrape_keywords(keywords: List[str], max_workers: int = MAX_WORKERS_PER_SOURCE,
+                    scraper_factory: Callable[[], ContextManager] = GupyScraper, label: str = 'Gupy',
+                    **scrape_kwargs) -> List[Dict]:
+    """
+    Faz scraping de várias keywords em paralelo. Cada worker usa o seu próprio
+    scraper (e Chrome, aberto uma única vez), emprestado de um pool; o resultado
+    segue a ordem das keywords e já sai deduplicado (mesma chave e mesma vaga
+    mantida que deduplicate_jobs), sem acumular as repetidas em memória.
+    Serve a qualquer fonte: basta passar a fábrica do scraper e o rótulo das mensagens.
+    """
+    if not keywords:
+        return []
+    # No máximo MAX_WORKERS_PER_SOURCE requisições simultâneas ao mesmo site
+    max_workers = max(1, min(max_workers, MAX_WORKERS_PER_SOURCE, len(keywords)))
+    scrapers: Queue = Queue()
+
+    def _scrape(item) -> List[Dict]:
+        i, kw = item
+        scraper = scrapers.get()
+        try:
+            print(f"\n🔍 {label} ({i}/{len(keywords)}): Buscando '{kw}'...")
+            jobs = scraper.scrape_jobs(term=kw, **scrape_kwargs)
+            print(f"✅ {label} '{kw}': {len(jobs)} vagas encontradas")
+            return jobs
+        except Exception as e:
+            print(f"❌ {label}: erro ao buscar '{kw}': {e}")
+            return []
+        finally:
+            scrapers.put(scraper)
+
+    all_jobs: List[Dict] = []
+    seen: set = set()
+    with ExitStack() as stack:
+        # Um Chrome por worker, aberto uma vez e reaproveitado entre as keywords
+        for _ in range(max_workers):
+            scrapers.put(stack.enter_context(scraper_factory()))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for jobs in executor.map(_scrape, enumerate(keywords, 1)):
+                for job in jobs:
+                    key = job.get('link') or job.get('jobId')
+                    if key and key not in seen:
+                        seen.add(key)
+                        all_jobs.append(job)
+    return all_jobs
 
 
 def main():
+    # Resumos por página saem no console (INFO); mensagens por vaga só com o nível DEBUG
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    logging.getLogger('httpx').setLevel(logging.WARNING)  # sem uma linha por requisição
     keywords = load_keywords('keywords.json')
     print("🚀 Gupy: iniciando scraping...")
-    all_jobs: List[Dict] = []
-    scraper = GupyScraper()
-    for i, kw in enumerate(keywords, 1):
-        print(f"\n🔍 ({i}/{len(keywords)}) '{kw}'...")
-        jobs = scraper.scrape_jobs(term=kw, remote_only=True, max_pages=10, max_days_old=3)
-        all_jobs.extend(jobs)
-    unique_jobs = deduplicate_jobs(all_jobs)
-    with open('vagas_gupy.json', 'w', encoding='utf-8') as f:
-        json.dump(unique_jobs, f, ensure_ascii=False, indent=2)
+    unique_jobs = scrape_keywords(keywords, remote_only=True, max_pages=10, max_days_old=3)
+    write_json('vagas_gupy.json', unique_jobs)
     print(f"\n✅ Gupy: {len(unique_jobs)} vagas únicas salvas em vagas_gupy.json")
 
 
@@ -1,15 +1,20 @@
 # indeed_scraper.py
 # -*- coding: utf-8 -*-
 import json
+import logging
 import re
+import sys
 import time
 import random
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, asdict
+from itertools import repeat
 from typing import List, Dict, Optional, Callable
 from urllib.parse import urlsplit, urlunsplit
 
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -26,14 +31,45 @@ try:
 except Exception:
     _USE_WDM = False
 
+try:
+    # opcional: escrita de JSON mais rápida
+    import orjson
+    _USE_ORJSON = True
+except ImportError:
+    _USE_ORJSON = False
+
+logger = logging.getLogger(__name__)
+
+# Filtro de senioridade no título (comparado já em minúsculas)
+SENIOR_RE = re.compile(r"\b(senior|sênior|sr)\b")
+CARD_SELECTOR = "div.cardOutline.tapItem, div.cardOutline.tapItem.result"
+# Campos do card, compilados uma vez (lxml roda a busca inteira em C)
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+TITLE_XPATH = etree.XPath("descendant-or-self::a[" + _HAS_CLASS.format("jcs-JobTitle") + "]")
+COMPANY_XPATH = etree.XPath('descendant-or-self::*[@data-testid="company-name"]')
+LOCATION_XPATH = etree.XPath('descendant-or-self::*[@data-testid="text-location"]')
+SNIPPET_XPATH = etree.XPath('descendant-or-self::*[@data-testid="belowJobSnippet"]')
+SLIDER_XPATH = etree.XPath(
+    "descendant-or-self::div[" + _HAS_CLASS.format("slider_sub_item") + "]//ul"
+    " | descendant-or-self::div[" + _HAS_CLASS.format("slider_sub_item") + "]"
+)
+# Nós de texto visíveis: fora de <script>/<style> (comentários já não casam com text())
+TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script or ancestor::style)]")
+# HTML de todos os cards numa única chamada ao navegador
+OUTER_HTML_JS = "return Array.from(document.querySelectorAll(arguments[0]), e => e.outerHTML);"
+
 
 # -------------------------
 # Utilidades de salvamento
 # -------------------------
 def _atomic_write_json(path: str, data) -> None:
     tmp = f"{path}.tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if _USE_ORJSON:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
     os.replace(tmp, path)  # gravação atômica
 
 def _normalize_url(u: Optional[str]) -> Optional[str]:
@@ -84,6 +120,62 @@ class JobInfo:
     resumo: Optional[str]
 
 
+def _text(el, sep: str = "") -> str:
+    """Equivalente ao get_text(sep, strip=True) do BS4: pedaços de texto aparados e não vazios."""
+    return sep.join(t for t in (piece.strip() for piece in TEXT_XPATH(el)) if t)
+
+
+def _first(xpath: etree.XPath, root):
+    found = xpath(root)
+    return found[0] if found else None
+
+
+def _parse_card(card_html: str, site: str) -> Optional[Dict]:
+    """Extrai os campos de um card. Função de módulo para poder rodar num ProcessPoolExecutor."""
+    # Sem título não há vaga: descarta antes de montar a árvore
+    if "jcs-JobTitle" not in card_html:
+        return None
+    try:
+        root = lxml_html.fromstring(card_html)
+
+        a_title = _first(TITLE_XPATH, root)
+        nome = (_text(a_title) if a_title is not None else None) or ""
+        
+        # Extrair URL correta usando data-jk ou href
+        url = None
+        if a_title is not None:
+            # Primeiro, tentar extrair data-jk para construir URL específica
+            data_jk = a_title.get("data-jk")
+            if data_jk:
+                url = f"{site}/viewjob?jk={data_jk}"
+            else:
+                # Fallback para href original
+                href = a_title.get("href")
+                if href:
+                    if href.startswith("/"):
+                        url = f"{site}{href}"
+                    else:
+                        url = href
+
+        empresa_el = _first(COMPANY_XPATH, root)
+        empresa = _text(empresa_el) if empresa_el is not None else None
+
+        local_el = _first(LOCATION_XPATH, root)
+        local = _text(local_el) if local_el is not None else None
+
+        resumo_el = _first(SNIPPET_XPATH, root)
+        if resumo_el is None:
+            resumo_el = _first(SLIDER_XPATH, root)
+        resumo = _text(resumo_el, " ") if resumo_el is not None else None
+
+        if not nome:
+            return None
+
+        return asdict(JobInfo(nome=nome, empresa=empresa, local=local, url=url, resumo=resumo))
+    except Exception:
+        return None
+
+
 class IndeedScraper:
     def __init__(
         self,
@@ -93,6 +185,7 @@ class IndeedScraper:
         site: str = "https://br.indeed.com",
         days: Optional[int] = 1,  # fromAge em dias; None para não enviar
         page_timeout: int = 15,
+        parse_workers: int = 0,  # processos para o parse dos cards; 0/1 = no processo atual
     ):
         self.chromedriver_path = chromedriver_path
         self.headless = headless
@@ -100,11 +193,48 @@ class IndeedScraper:
         self.site = site.rstrip("/")
         self.days = days
         self.page_timeout = page_timeout
+        self.parse_workers = parse_workers
         self.driver: Optional[webdriver.Chrome] = None
+        # Pool de processos do parse, criado uma vez por sessão (open() ... close())
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
 
     # -------------------------
     # Setup & helpers
     # -------------------------
+    def open(self) -> 'IndeedScraper':
+        """Abre um Chrome (e o pool do parse) reutilizados pelas próximas chamadas de scrape_jobs, até close()."""
+        if self.driver is None:
+            self.driver = self._setup_driver()
+        # O parse (lxml + regex) é CPU puro: com parse_workers > 1 roda fora do GIL
+        if self._parse_pool is None and self.parse_workers > 1:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        return self
+
+    def close(self) -> None:
+        if self._parse_pool:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def _parse_cards(self, cards: List[str]) -> List[Optional[Dict]]:
+        """Parse dos cards no pool da sessão; se o pool quebrar, descarta-o e refaz no processo atual."""
+        if self._parse_pool:
+            try:
+                return list(self._parse_pool.map(_parse_card, cards, repeat(self.site), chunksize=8))
+            except BrokenProcessPool as e:
+                logger.warning("⚠️ Pool de parse quebrado (%s); seguindo no processo atual", e)
+                self._parse_pool.shutdown(wait=False)
+                self._parse_pool = None
+        return [self._extract_job_info(card) for card in cards]
+
+    def __enter__(self) -> 'IndeedScraper':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _setup_driver(self) -> webdriver.Chrome:
         opts = ChromeOptions()
         opts.page_load_strategy = "eager"
@@ -119,8 +249,15 @@ class IndeedScraper:
         opts.add_argument("--no-sandbox")
         opts.add_argument("--disable-dev-shm-usage")
         opts.add_argument("--window-size=1366,768")
+        opts.add_argument("--disk-cache-size=104857600")
         opts.add_experimental_option("excludeSwitches", ["enable-automation"])
         opts.add_experimental_option("useAutomationExtension", False)
+        # Sem imagens e fontes; o CSS fica ligado porque os cards dependem dele para renderizar
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
 
         service = ChromeService(self.chromedriver_path)
 
@@ -153,64 +290,32 @@ class IndeedScraper:
                     )
                 )
             ).click()
-            time.sleep(0.3)
+            # Espera o banner sumir em vez de um sleep fixo
+            WebDriverWait(self.driver, 2).until(
+                EC.invisibility_of_element_located((By.CSS_SELECTOR, "#onetrust-banner-sdk"))
+            )
         except Exception:
             pass
 
-    def _build_url(self, query: str, start: int) -> str:
-        # exemplo: https://br.indeed.com/jobs?q=java&l=Home%20Office&fromage=1&start=10&sort=date
+    def _build_url_prefix(self, query: str) -> str:
+        """Parte fixa da URL de busca de um termo; só o start muda entre as páginas."""
         q = query.strip().replace(" ", "+")
         l = self.location.strip().replace(" ", "+")
         params = [f"q={q}", f"l={l}", "sort=date"]
         # ⚠️ A flag de remoto no Indeed muda bastante; deixe sem forçar sc=... por robustez.
         if self.days is not None:
             params.append(f"fromage={int(self.days)}")
-        params.append(f"start={int(start)}")
         return f"{self.site}/jobs?{'&'.join(params)}"
 
+    def _build_url(self, query: str, start: int) -> str:
+        # exemplo: https://br.indeed.com/jobs?q=java&l=Home%20Office&fromage=1&start=10&sort=date
+        return f"{self._build_url_prefix(query)}&start={int(start)}"
+
     # -------------------------
     # Parsing
     # -------------------------
     def _extract_job_info(self, card_html: str) -> Optional[Dict]:
-        try:
-            soup = BeautifulSoup(card_html, "html.parser")
-
-            a_title = soup.select_one("a.jcs-JobTitle")
-            nome = (a_title.get_text(strip=True) if a_title else None) or ""
-            
-            # Extrair URL correta usando data-jk ou href
-            url = None
-            if a_title:
-                # Primeiro, tentar extrair data-jk para construir URL específica
-                data_jk = a_title.get("data-jk")
-                if data_jk:
-                    url = f"{self.site}/viewjob?jk={data_jk}"
-                else:
-                    # Fallback para href original
-                    href = a_title.get("href")
-                    if href:
-                        if href.startswith("/"):
-                            url = f"{self.site}{href}"
-                        else:
-                            url = href
-
-            empresa_el = soup.select_one('[data-testid="company-name"]')
-            empresa = empresa_el.get_text(strip=True) if empresa_el else None
-
-            local_el = soup.select_one('[data-testid="text-location"]')
-            local = local_el.get_text(strip=True) if local_el else None
-
-            resumo_el = soup.select_one('[data-testid="belowJobSnippet"]')
-            if not resumo_el:
-                resumo_el = soup.select_one("div.slider_sub_item ul, div.slider_sub_item")
-            resumo = resumo_el.get_text(" ", strip=True) if resumo_el else None
-
-            if not nome:
-                return None
-
-            return asdict(JobInfo(nome=nome, empresa=empresa, local=local, url=url, resumo=resumo))
-        except Exception:
-            return None
+        return _parse_card(card_html, self.site)
 
     # -------------------------
     # Scraping principal
@@ -224,14 +329,19 @@ class IndeedScraper:
         # NEW: callback de progresso p/ salvar incrementalmente
         progress_callback: Optional[Callable[[List[Dict], Dict], None]] = None,
     ) -> List[Dict]:
-        self.driver = self._setup_driver()
+        # Sem open(), abre e fecha um Chrome (e o pool do parse) só para esta chamada
+        owns_driver = self.driver is None
+        if owns_driver:
+            self.open()
         wait = WebDriverWait(self.driver, self.page_timeout)
         all_jobs: List[Dict] = []
 
+        url_prefix = self._build_url_prefix(term)
+
         try:
             for page in range(max_pages):
                 start = page * 10  # indeed pagina em múltiplos de 10
-                url = self._build_url(term, start=start)
+                url = f"{url_prefix}&start={start}"
                 print(f"➡️  Carregando página {page+1}/{max_pages}: {url}")
                 self.driver.get(url)
 
@@ -246,12 +356,12 @@ class IndeedScraper:
                         progress_callback(all_jobs, {"term": term, "page": page + 1, "url": url})
                     continue
 
-                time.sleep(0.8)
-
-                cards = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "div.cardOutline.tapItem, div.cardOutline.tapItem.result",
-                )
+                # Espera explícita pelos cards (em vez de time.sleep fixo)
+                try:
+                    wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+                    cards = self.driver.execute_script(OUTER_HTML_JS, CARD_SELECTOR) or []
+                except TimeoutException:
+                    cards = []
 
                 if not cards:
                     print("🛑 Nenhuma vaga encontrada; encerrando a paginação.")
@@ -263,24 +373,24 @@ class IndeedScraper:
                 print(f"🔎 Encontrados {len(cards)} cards na página {page+1}.")
 
                 page_jobs: List[Dict] = []
-                for idx, card in enumerate(cards, start=1):
+                senior_count = 0
+                for info in self._parse_cards(cards):
                     try:
-                        outer_html = card.get_attribute("outerHTML")
-                        info = self._extract_job_info(outer_html)
                         if not info:
                             continue
 
                         if senior_filter:
                             nome_lower = (info.get("nome") or "").lower()
-                            if re.search(r"\b(senior|sênior|sr)\b", nome_lower):
-                                print(f"🚫 (Filtro SR) Ignorando vaga: {info.get('nome', 'N/A')}")
+                            if SENIOR_RE.search(nome_lower):
+                                senior_count += 1
+                                logger.debug("🚫 (Filtro SR) Ignorando vaga: %s", info.get('nome', 'N/A'))
                                 continue
 
                         page_jobs.append(info)
                     except Exception:
                         continue
 
-                print(f"✅ Vagas válidas nesta página: {len(page_jobs)}")
+                logger.info("✅ Vagas válidas nesta página: %d (%d Senior/SR ignoradas)", len(page_jobs), senior_count)
                 all_jobs.extend(page_jobs)
 
                 # checkpoint após cada página (removido para evitar problemas)
@@ -292,8 +402,8 @@ class IndeedScraper:
 
             return all_jobs
         finally:
-            if self.driver:
-                self.driver.quit()
+            if owns_driver:
+                self.close()
 
 
 # -------------------------
@@ -309,6 +419,8 @@ def load_keywords(filename: str = 'keywords.json') -> List[str]:
 
 
 def main():
+    # Resumos por página saem no console (INFO); mensagens por vaga só com o nível DEBUG
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
     OUTFILE = 'vagas_indeed.json'
     all_jobs: List[Dict] = []
     keywords = load_keywords('keywords.json')
@@ -327,6 +439,7 @@ def main():
     scraper = IndeedScraper(headless=True)
 
     try:
+        scraper.open()  # um único Chrome para todas as keywords
         for i, kw in enumerate(keywords, 1):
             print(f"\n🔍 ({i}/{len(keywords)}) '{kw}'...")
             jobs = scraper.scrape_jobs(
@@ -342,6 +455,7 @@ def main():
     except Exception as e:
         print(f"\n⚠️ Erro inesperado: {e}. Salvando progresso parcial...")
     finally:
+        scraper.close()
         unique_jobs = _deduplicate_jobs(all_jobs)
         _atomic_write_json(OUTFILE, unique_jobs)
         print(f"\n✅ Indeed: {len(unique_jobs)} vagas únicas salvas em {OUTFILE}")
@@ -6,13 +6,16 @@ controle de banner de cookies e scroll para lazy-load da lista de resultados.
 """
 
 import json
+import logging
 import re
+import sys
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin, urlencode, quote_plus
 
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
@@ -22,10 +25,160 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Mesmos helpers de XPath/texto do scraper do Indeed (uma única implementação)
+from indeed_scraper import _HAS_CLASS, _first, _text
+
+try:
+    # opcional: escrita de JSON mais rápida
+    import orjson
+    _USE_ORJSON = True
+except ImportError:
+    _USE_ORJSON = False
+
+try:
+    # opcional: parser HTML em C (lexbor) com motor CSS próprio, ainda mais rápido para os cards
+    from selectolax.lexbor import LexborHTMLParser
+    _USE_SELECTOLAX = True
+except ImportError:
+    _USE_SELECTOLAX = False
+
+try:
+    # opcional: regex em tempo linear (google-re2) para a classificação do contrato
+    import re2 as fast_re
+except ImportError:
+    fast_re = re
+
+try:
+    # opcional: listagem pelo endpoint público (guest) por HTTP, sem abrir o Chrome
+    import httpx
+    _USE_HTTPX = True
+except ImportError:
+    _USE_HTTPX = False
+
+logger = logging.getLogger(__name__)
+
+
+# "5 minutes ago" / "há 2 dias" numa única busca; a unidade casada indexa RELATIVE_TIME_UNITS
+RELATIVE_TIME_RE = re.compile(
+    r'(\d+)\s+(minute|hour|day|week)|há\s+(\d+)\s+(min|hora|dia|semana)'
+)
+RELATIVE_TIME_UNITS = {
+    'minute': 'minutes', 'hour': 'hours', 'day': 'days', 'week': 'weeks',
+    'min': 'minutes', 'hora': 'hours', 'dia': 'days', 'semana': 'weeks',
+}
+CARD_SELECTOR = 'ul.jobs-search__results-list > li'
+# Campos de todos os cards extraídos no próprio DOM do navegador, numa única chamada:
+# mesma tupla de _card_fields_lexbor/_card_fields_lxml (null quando o card não tem link)
+CARD_FIELDS_JS = """
+const txt = el => el ? el.textContent.trim() : null;
+return Array.from(document.querySelectorAll(arguments[0]), li => {
+    const base = li.querySelector('.base-card.base-search-card.job-search-card') || li;
+    const a = base.querySelector('a.base-card__full-link[href]') || base.querySelector('a[href*="/jobs/view/"]');
+    if (!a) return null;
+    const title = base.querySelector('h3.base-search-card__title');
+    const time = base.querySelector('time.job-search-card__listdate--new') || base.querySelector('time');
+    return [
+        a.getAttribute('href'),
+        txt(title || a),
+        txt(base.querySelector('h4.base-search-card__subtitle')),
+        txt(base.querySelector('span.job-search-card__location')),
+        txt(time),
+        time ? time.getAttribute('datetime') : null,
+        base.textContent.replace(/\\s+/g, ' ').trim(),
+        base.getAttribute('data-entity-urn'),
+    ];
+});
+"""
+# Só a contagem de cards: evita serializar uma referência de WebElement por card
+COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+# Tipo de contrato numa única passada; o grupo de cada match (lastgroup) indexa CONTRACT_CANON
+CONTRACT_RE = fast_re.compile(
+    r'(?P<efetivo>efetivo|clt)|(?P<temporario>tempor)|(?P<estagio>est[aá]g)|(?P<aprendiz>aprendiz)|(?P<pj>\bpj\b|p\.?j\.?)'
+)
+CONTRACT_CANON = {
+    'efetivo': 'Efetivo', 'temporario': 'Temporário', 'estagio': 'Estágio', 'aprendiz': 'Aprendiz', 'pj': 'PJ',
+}
+# Com mais de um termo no texto vence o de menor posição aqui, não o primeiro no texto ("estágio clt" → Efetivo)
+CONTRACT_PRIORITY = {group: rank for rank, group in enumerate(('efetivo', 'temporario', 'estagio', 'aprendiz', 'pj'))}
+# Campos do card em XPath compilado uma vez (lxml roda a busca inteira em C, sem CSS por chamada)
+CARD_XPATH = etree.XPath(
+    "//ul[" + _HAS_CLASS.format("jobs-search__results-list") + "]/li"
+)
+BASE_CARD_XPATH = etree.XPath(
+    "descendant-or-self::*[" + " and ".join(
+        _HAS_CLASS.format(c) for c in ("base-card", "base-search-card", "job-search-card")
+    ) + "]"
+)
+FULL_LINK_XPATH = etree.XPath("descendant::a[" + _HAS_CLASS.format("base-card__full-link") + " and @href]")
+VIEW_LINK_XPATH = etree.XPath("descendant::a[contains(@href, '/jobs/view/')]")
+TITLE_XPATH = etree.XPath("descendant::h3[" + _HAS_CLASS.format("base-search-card__title") + "]")
+COMPANY_XPATH = etree.XPath("descendant::h4[" + _HAS_CLASS.format("base-search-card__subtitle") + "]")
+LOCATION_XPATH = etree.XPath("descendant::span[" + _HAS_CLASS.format("job-search-card__location") + "]")
+NEW_DATE_XPATH = etree.XPath("descendant::time[" + _HAS_CLASS.format("job-search-card__listdate--new") + "]")
+TIME_XPATH = etree.XPath("descendant::time")
+# Endpoint guest: devolve os <li> dos cards em HTML puro, paginado por &start=
+GUEST_SEARCH_PATH = '/jobs-guest/jobs/api/seeMoreJobPostings/search'
+# URN da vaga no HTML do card, lido sem montar a árvore (fallback de page_source)
+JOB_URN_RE = re.compile(r'urn:li:jobPosting:\d+')
+# Data de publicação (atributo datetime do <time>), também lida antes do parse
+DATETIME_ATTR_RE = re.compile(r'datetime="(\d{4}-\d{2}-\d{2})"')
+# Vagas patrocinadas ficam fora da ordem por data: uma antiga não encerra a busca
+PROMOTED_RE = re.compile(r'promoted', re.IGNORECASE)
+# Termos de localidade que indicam vaga remota
+REMOTE_KEYWORDS = ('remoto', 'remote', 'home office')
+
+
+def _guest_card_htmls(text: str) -> List[str]:
+    """HTML de cada <li> de topo da resposta do endpoint guest (mesmo formato dos cards da página)."""
+    if not text.strip():
+        return []
+    try:
+        fragments = lxml_html.fragments_fromstring(text)
+    except etree.ParserError:
+        return []
+    return [
+        etree.tostring(el, encoding='unicode', with_tail=False)
+        for el in fragments if getattr(el, 'tag', None) == 'li'
+    ]
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> Optional[datetime]:
+    """
+    datetime.fromisoformat memoizado: os cards repetem poucas datas distintas, e
+    a mesma data é lida no filtro por regex e de novo ao montar a vaga. None se inválida.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _relative_offset(t: str) -> Optional[timedelta]:
+    """
+    Converte "5 minutes ago" / "há 2 dias" no deslocamento correspondente.
+    Memoizado: poucos textos distintos se repetem entre os cards. Guarda o
+    timedelta (e não a data) para que o resultado não envelheça no cache.
+    """
+    m = RELATIVE_TIME_RE.search(t)
+    if not m:
+        return None
+    amount, unit = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+    return timedelta(**{RELATIVE_TIME_UNITS[unit]: int(amount)})
+
 
 class LinkedInScraper:
     BASE = "https://br.linkedin.com"
     SEARCH_PATH = "/jobs/search"
+    # Parâmetros fixos da busca, codificados uma única vez
+    SEARCH_FIXED_QUERY = urlencode({
+        "geoId": "106057199",
+        "f_TPR": "r86400",  # últimas 24h
+        "f_WT": "2",        # remoto
+        "position": "1",
+        "sortBy": "DD",     # mais recentes primeiro: permite parar na primeira vaga antiga
+    }, quote_via=quote_plus)
 
     def __init__(
         self,
@@ -40,6 +193,34 @@ class LinkedInScraper:
         self.headless = headless
         self.user_agent = user_agent
         self.driver: Optional[webdriver.Chrome] = None
+        self.keep_driver = False
+        # None = ainda não testado; False = endpoint guest bloqueado, usa só o Selenium
+        self.guest_available: Optional[bool] = None if _USE_HTTPX else False
+        # URNs das vagas já coletadas na sessão (open() ... close(), entre keywords): não são
+        # reprocessadas. Só entram vagas mantidas, para que antigas continuem acionando a parada
+        self._seen_urns: set = set()
+
+    def open(self) -> 'LinkedInScraper':
+        """
+        Mantém o Chrome aberto entre as chamadas de scrape_jobs, até close(). O
+        navegador só é criado na primeira vez que o caminho Selenium for necessário.
+        """
+        self.keep_driver = True
+        self._seen_urns.clear()
+        return self
+
+    def close(self) -> None:
+        self.keep_driver = False
+        self._seen_urns.clear()
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+
+    def __enter__(self) -> 'LinkedInScraper':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _setup_driver(self) -> webdriver.Chrome:
         opts = Options()
@@ -49,14 +230,22 @@ class LinkedInScraper:
         opts.add_argument('--disable-dev-shm-usage')
         opts.add_argument('--disable-gpu')
         opts.add_argument('--window-size=1366,900')
+        opts.add_argument('--disk-cache-size=104857600')
         opts.add_argument('--lang=pt-BR')
         opts.add_argument('--accept-lang=pt-BR,pt;q=0.9,en;q=0.8')
         if self.user_agent:
             opts.add_argument(f'--user-agent={self.user_agent}')
+        # Sem imagens e fontes; o CSS fica ligado porque a lista de resultados depende dele
+        opts.add_argument('--blink-settings=imagesEnabled=false')
+        opts.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
 
         service = Service(self.chromedriver_path)
+        # Sem implicitly_wait: as esperas são explícitas e as contagens de cards
+        # no scroll não podem travar 8s quando a lista ainda está vazia
         driver = webdriver.Chrome(service=service, options=opts)
-        driver.implicitly_wait(8)
         return driver
 
     def _dismiss_login_overlays(self, quick_timeout: float = 0.2, attempts: int = 20):
@@ -166,7 +355,7 @@ class LinkedInScraper:
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'ul.jobs-search__results-list'))
             )
             WebDriverWait(self.driver, timeout).until(
-                lambda d: len(d.find_elements(By.CSS_SELECTOR, 'ul.jobs-search__results-list > li')) > 0
+                EC.presence_of_element_located((By.CSS_SELECTOR, CARD_SELECTOR))
             )
             return ul
         except TimeoutException:
@@ -185,7 +374,7 @@ class LinkedInScraper:
             time.sleep(pause)
 
             try:
-                count = len(self.driver.find_elements(By.CSS_SELECTOR, 'ul.jobs-search__results-list > li'))
+                count = self.driver.execute_script(COUNT_JS, CARD_SELECTOR) or 0
             except Exception:
                 count = 0
 
@@ -209,108 +398,175 @@ class LinkedInScraper:
             return kw
         return f'"{kw}"'
 
+    def _search_query(self, keyword: str, location: str) -> str:
+        # Só keyword e location são codificados por chamada; o resto vem pronto em SEARCH_FIXED_QUERY
+        query = urlencode({"keywords": self._ensure_quoted(keyword), "location": location}, quote_via=quote_plus)
+        return f"{query}&{self.SEARCH_FIXED_QUERY}"
+
     def _build_search_url(self, keyword: str, location: str = "Brasil", start: int = 0) -> str:
-        quoted_kw = self._ensure_quoted(keyword)
-        params = {
-            "keywords": quoted_kw,
-            "location": location,
-            "geoId": "106057199",
-            "f_TPR": "r86400",  # últimas 24h
-            "f_WT": "2",        # remoto
-            "position": "1",
-            "pageNum": start // 25
-        }
-        query = urlencode(params, quote_via=quote_plus)
-        return f"{self.BASE}{self.SEARCH_PATH}?{query}"
+        return f"{self.BASE}{self.SEARCH_PATH}?{self._search_query(keyword, location)}&pageNum={start // 25}"
+
+    def _build_guest_url(self, keyword: str, location: str = "Brasil", start: int = 0) -> str:
+        return f"{self.BASE}{GUEST_SEARCH_PATH}?{self._search_query(keyword, location)}&start={start}"
+
+    def _scrape_guest(self, keyword: str, location: str, max_pages: int, cutoff_date: datetime,
+                      results: List[Dict]) -> bool:
+        """
+        Lista as vagas pelo endpoint guest, sem navegador, uma página por vez: para na
+        primeira página vazia ou com vaga antiga, sem baixar as seguintes. As vagas
+        válidas vão para results. Retorna False se o endpoint bloquear ou falhar; aí a
+        busca segue pelo Selenium, que pula as vagas já coletadas aqui (URNs vistos).
+        """
+        headers = {'User-Agent': self.user_agent, 'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8'}
+        start = 0
+        try:
+            with httpx.Client(headers=headers, timeout=15, follow_redirects=True) as client:
+                for page_num in range(1, max_pages + 1):
+                    response = client.get(self._build_guest_url(keyword, location, start))
+                    # 429/999 ou authwall em qualquer página: endpoint bloqueado para esta sessão
+                    if response.status_code != 200 or 'authwall' in response.url.path:
+                        self.guest_available = False
+                        print(f"⚠️ Endpoint guest bloqueado na página {page_num} "
+                              f"(HTTP {response.status_code}); usando o navegador")
+                        return False
+                    page = _guest_card_htmls(response.text)
+                    if not page:
+                        if page_num > 1:
+                            break  # acabaram os resultados
+                        # Primeira página sem cards: busca vazia, ou página de login/desafio
+                        # (corpo não vazio) -- nesse caso o endpoint fica bloqueado para a sessão
+                        if response.text.strip():
+                            self.guest_available = False
+                        print("⚠️ Endpoint guest sem cards na primeira página; usando o navegador")
+                        return False
+                    cards, found_old = self._cards_from_html(page, cutoff_date)
+                    page_jobs, found_old_parsed = self._filter_cards(cards, cutoff_date)
+                    results.extend(page_jobs)
+                    # Resultados por data: depois da primeira vaga antiga, o resto também é antigo
+                    if found_old or found_old_parsed:
+                        print(f"🛑 Página {page_num} contém vagas antigas - não avançará para próxima página")
+                        break
+                    start += len(page)
+        except httpx.HTTPError as e:
+            print(f"⚠️ Falha na busca por HTTP ({e}); usando o navegador")
+            return False
+        return True
 
     @staticmethod
     def _parse_relative_time(text: str) -> Optional[datetime]:
         if not text:
             return None
-        t = text.lower().strip()
-        m = re.search(r'(\d+)\s+minute', t)
-        if m:
-            return datetime.now() - timedelta(minutes=int(m.group(1)))
-        m = re.search(r'(\d+)\s+hour', t)
-        if m:
-            return datetime.now() - timedelta(hours=int(m.group(1)))
-        m = re.search(r'(\d+)\s+day', t)
-        if m:
-            return datetime.now() - timedelta(days=int(m.group(1)))
-        m = re.search(r'há\s+(\d+)\s+min', t)
-        if m:
-            return datetime.now() - timedelta(minutes=int(m.group(1)))
-        m = re.search(r'há\s+(\d+)\s+hora', t)
-        if m:
-            return datetime.now() - timedelta(hours=int(m.group(1)))
-        m = re.search(r'há\s+(\d+)\s+dia', t)
-        if m:
-            return datetime.now() - timedelta(days=int(m.group(1)))
-        return None
+        offset = _relative_offset(text.lower().strip())
+        return datetime.now() - offset if offset is not None else None
 
     @staticmethod
     def _normalize_contract(title_or_meta: str) -> Optional[str]:
+        """Classifica o contrato; recebe o texto já em minúsculas (quem chama já o tem assim)."""
         if not title_or_meta:
             return None
-        s = title_or_meta.lower()
-        if 'efetivo' in s or 'clt' in s:
-            return 'Efetivo'
-        if 'tempor' in s:
-            return 'Temporário'
-        if 'estág' in s or 'estag' in s:
-            return 'Estágio'
-        if 'aprendiz' in s:
-            return 'Aprendiz'
-        if re.search(r'\bpj\b|p\.?j\.?', s):
-            return 'PJ'
-        return None
+        best = None
+        for m in CONTRACT_RE.finditer(title_or_meta):
+            group = m.lastgroup
+            if group == 'efetivo':
+                return CONTRACT_CANON[group]  # prioridade máxima: nada a comparar
+            if best is None or CONTRACT_PRIORITY[group] < CONTRACT_PRIORITY[best]:
+                best = group
+        return CONTRACT_CANON[best] if best else None
 
     @staticmethod
-    def _extract_job_info(card_html: str) -> Optional[Dict]:
-        soup = BeautifulSoup(card_html, 'html.parser')
+    def _card_fields_lexbor(card_html: str) -> Optional[Tuple]:
+        """Campos brutos do card via selectolax (lexbor, em C); None se não houver link."""
+        tree = LexborHTMLParser(card_html)
+        base = tree.css_first('.base-card.base-search-card.job-search-card') or tree.body
 
-        base = soup.select_one('.base-card.base-search-card.job-search-card') or soup
+        a_full = base.css_first('a.base-card__full-link[href]') or base.css_first('a[href*="/jobs/view/"]')
+        if a_full is None:
+            return None
+        title_el = base.css_first('h3.base-search-card__title')
+        empresa_el = base.css_first('h4.base-search-card__subtitle a, h4.base-search-card__subtitle')
+        loc_el = base.css_first('span.job-search-card__location')
+        time_el = base.css_first('time.job-search-card__listdate--new') or base.css_first('time')
+        return (
+            a_full.attributes.get('href'),
+            (title_el or a_full).text(strip=True),
+            empresa_el.text(strip=True) if empresa_el is not None else None,
+            loc_el.text(strip=True) if loc_el is not None else None,
+            time_el.text(strip=True) if time_el is not None else None,
+            time_el.attributes.get('datetime') if time_el is not None else None,
+            # lexbor junta também os nós vazios; colapsa os espaços (texto só usado em buscas por substring)
+            ' '.join(base.text(separator=' ', strip=True).split()),
+            base.attributes.get('data-entity-urn'),
+        )
 
-        a_full = base.select_one('a.base-card__full-link[href]') or base.select_one('a[href*="/jobs/view/"]')
-        if not a_full:
+    @staticmethod
+    def _card_fields_lxml(card_html: str) -> Optional[Tuple]:
+        """Mesmos campos de _card_fields_lexbor, via lxml + XPath (sem selectolax instalado)."""
+        root = lxml_html.fromstring(card_html)
+        base = _first(BASE_CARD_XPATH, root)
+        if base is None:
+            base = root
+
+        a_full = _first(FULL_LINK_XPATH, base)
+        if a_full is None:
+            a_full = _first(VIEW_LINK_XPATH, base)
+        if a_full is None:
             return None
-        href = a_full.get('href')
-        link = href if href.startswith('http') else urljoin("https://br.linkedin.com", href)
+        title_el = _first(TITLE_XPATH, base)
+        empresa_el = _first(COMPANY_XPATH, base)
+        loc_el = _first(LOCATION_XPATH, base)
+        time_el = _first(NEW_DATE_XPATH, base)
+        if time_el is None:
+            time_el = _first(TIME_XPATH, base)
+        return (
+            a_full.get('href'),
+            _text(title_el if title_el is not None else a_full),
+            _text(empresa_el) if empresa_el is not None else None,
+            _text(loc_el) if loc_el is not None else None,
+            _text(time_el) if time_el is not None else None,
+            time_el.get('datetime') if time_el is not None else None,
+            _text(base, " "),
+            base.get('data-entity-urn'),
+        )
+
+    @staticmethod
+    def _read_card_fields(card_html: str) -> Optional[Tuple]:
+        """Campos brutos do card (selectolax ou lxml); None se não houver link."""
+        # Sem link para a vaga o card é descartado: evita montar a árvore à toa
+        if 'base-card__full-link' not in card_html and '/jobs/view/' not in card_html:
+            return None
+        read_fields = LinkedInScraper._card_fields_lexbor if _USE_SELECTOLAX else LinkedInScraper._card_fields_lxml
+        return read_fields(card_html)
 
-        title_el = base.select_one('h3.base-search-card__title')
-        nome = title_el.get_text(strip=True) if title_el else (a_full.get_text(strip=True) if a_full else None)
+    @staticmethod
+    def _extract_job_info(card_html: str) -> Optional[Dict]:
+        fields = LinkedInScraper._read_card_fields(card_html)
+        return LinkedInScraper._job_from_fields(fields) if fields is not None else None
 
-        empresa_el = base.select_one('h4.base-search-card__subtitle a, h4.base-search-card__subtitle')
-        empresa = empresa_el.get_text(strip=True) if empresa_el else None
+    @staticmethod
+    def _job_from_fields(fields: Tuple) -> Dict:
+        """Monta a vaga a partir da tupla de campos brutos (do navegador ou do parse do HTML)."""
+        href, nome, empresa, localidade, time_text, dt_attr, footer_text, ent = fields
 
-        loc_el = base.select_one('span.job-search-card__location')
-        localidade = loc_el.get_text(strip=True) if loc_el else None
+        link = href if href.startswith('http') else urljoin("https://br.linkedin.com", href)
         loc_low = (localidade or '').lower()
-        remoto = any(k in loc_low for k in ['remoto', 'remote', 'home office'])
+        remoto = any(k in loc_low for k in REMOTE_KEYWORDS)
 
-        time_el = base.select_one('time.job-search-card__listdate--new') or base.select_one('time')
-        data_iso = None
+        data_dt = None
         data_str = None
-        if time_el:
-            data_str = time_el.get_text(strip=True) or None
-            dt_attr = time_el.get('datetime')
-            if dt_attr:
-                try:
-                    data_iso = datetime.fromisoformat(dt_attr).isoformat()
-                except Exception:
-                    rel = LinkedInScraper._parse_relative_time(data_str or '')
-                    data_iso = rel.isoformat() if rel else None
-            else:
-                rel = LinkedInScraper._parse_relative_time(data_str or '')
-                data_iso = rel.isoformat() if rel else None
-
-        footer_text = base.get_text(" ", strip=True)
-        promovida = 'promoted' in footer_text.lower()
-        easy_apply = 'easy apply' in footer_text.lower() or 'seja um dos primeiros' in footer_text.lower()
-        tipo = LinkedInScraper._normalize_contract(f"{nome} {localidade} {footer_text}") or None
+        if time_text is not None:
+            data_str = time_text or None
+            data_dt = _parse_iso_date(dt_attr) if dt_attr else None
+            if data_dt is None:
+                data_dt = LinkedInScraper._parse_relative_time(data_str or '')
+
+        # Texto do card inteiro, lido numa só passada e em minúsculas uma única vez; já contém
+        # título e localidade, então a classificação do contrato roda direto sobre ele
+        footer_low = footer_text.lower()
+        promovida = 'promoted' in footer_low
+        easy_apply = 'easy apply' in footer_low or 'seja um dos primeiros' in footer_low
+        tipo = LinkedInScraper._normalize_contract(footer_low) or None
 
         job_id = None
-        ent = base.get('data-entity-urn')
         if ent and 'jobPosting:' in ent:
             try:
                 job_id = ent.split('jobPosting:')[-1]
@@ -321,83 +577,124 @@ class LinkedInScraper:
             'jobId': job_id,
             'link': link,
             'nome': nome,
-            'empresa': empresa,
-            'localidade': localidade,
+            # Empresas e localidades se repetem muito entre cards: uma única string por valor
+            'empresa': sys.intern(empresa) if empresa else empresa,
+            'localidade': sys.intern(localidade) if localidade else localidade,
             'remoto': remoto,
             'tipoContrato': tipo,
             'promovida': promovida,
             'easyApply': easy_apply,
             'insights': None,
-            'dataPublicacao': data_iso,
-            'dataPublicacaoStr': data_str
+            'dataPublicacao': data_dt.isoformat() if data_dt else None,
+            'dataPublicacaoStr': data_str,
+            # datetime já calculado, para o filtro de data não reler o ISO (removido antes de salvar)
+            '_date_dt': data_dt,
         }
 
-    def _collect_cards_current_page(self, cutoff_date: datetime) -> List[Dict]:
-        results: List[Dict] = []
-
+    @staticmethod
+    def _cards_from_html(card_htmls, cutoff_date: datetime) -> Tuple[List[Tuple], bool]:
+        """
+        (urn, extrator, card) de cada HTML de card, e se apareceu vaga antiga. Urn e
+        data são lidos por regex, antes de qualquer parse: cards com data anterior ao
+        corte nem são montados. Com os resultados ordenados por data (sortBy=DD), a
+        primeira vaga antiga não patrocinada encerra a leitura.
+        """
         cards = []
-        try:
-            cards = self.driver.find_elements(By.CSS_SELECTOR, 'ul.jobs-search__results-list > li')
-        except Exception:
-            cards = []
-
-        if not cards:
-            html = self.driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            li_nodes = soup.select('ul.jobs-search__results-list > li')
-            print(f"   • fallback page_source -> {len(li_nodes)} cards (soup)")
-            for li in li_nodes:
-                try:
-                    info = self._extract_job_info(str(li))
-                    if not info:
-                        continue
-                    # Filtro: excluir vagas Senior/SR
-                    nome = (info.get('nome') or '').lower()
-                    if 'senior' in nome or 'sr' in nome:
-                        print(f"🚫 Vaga Senior/SR filtrada: {info.get('nome', 'N/A')}")
+        for card_html in card_htmls:
+            m = DATETIME_ATTR_RE.search(card_html)
+            if m:
+                card_dt = _parse_iso_date(m.group(1))
+                if card_dt is not None and card_dt < cutoff_date:
+                    if PROMOTED_RE.search(card_html):
                         continue
-                    if info.get('dataPublicacao'):
-                        try:
-                            dt = datetime.fromisoformat(info['dataPublicacao'])
-                        except ValueError:
-                            dt = None
-                        if dt and dt < cutoff_date:
-                            continue
-                    results.append(info)
-                except Exception:
-                    continue
-            return results
+                    return cards, True
+            m = JOB_URN_RE.search(card_html)
+            cards.append((m.group(0) if m else None, _job_from_card_html, card_html))
+        return cards, False
 
-        for card in cards:
-            self._dismiss_login_overlays(quick_timeout=0.05, attempts=2)
+    def _filter_cards(self, cards: List[Tuple], cutoff_date: datetime) -> Tuple[List[Dict], bool]:
+        """
+        Filtra os cards; retorna as vagas válidas e se apareceu vaga antiga (a primeira
+        não patrocinada encerra o laço). Cada card só gera log em DEBUG; em INFO, um resumo.
+        """
+        found_old = False
+        results: List[Dict] = []
+        seen = self._seen_urns
+        seen_count = senior_count = old_count = 0
+        for urn, extract, card in cards:
+            # Vaga já coletada (em outra keyword desta sessão): pula antes de montar qualquer coisa
+            if urn and urn in seen:
+                seen_count += 1
+                continue
             try:
-                info = self._extract_job_info(card.get_attribute('outerHTML'))
+                info = extract(card)
                 if not info:
                     continue
+                dt = info.pop('_date_dt', None)
                 # Filtro: excluir vagas Senior/SR
                 nome = (info.get('nome') or '').lower()
                 if 'senior' in nome or 'sr' in nome:
-                    print(f"🚫 Vaga Senior/SR filtrada: {info.get('nome', 'N/A')}")
+                    senior_count += 1
+                    logger.debug("🚫 Vaga Senior/SR filtrada: %s", info.get('nome', 'N/A'))
+                    continue
+                if dt and dt < cutoff_date:
+                    old_count += 1
+                    if not info.get('promovida'):
+                        found_old = True
+                        break
                     continue
-                if info.get('dataPublicacao'):
-                    try:
-                        dt = datetime.fromisoformat(info['dataPublicacao'])
-                    except ValueError:
-                        dt = None
-                    if dt and dt < cutoff_date:
-                        continue
                 results.append(info)
+                if urn:
+                    seen.add(urn)
             except Exception:
                 continue
 
-        return results
+        logger.info("   • %d válidas; ignoradas: %d já vistas, %d antigas, %d Senior/SR",
+                    len(results), seen_count, old_count, senior_count)
+        return results, found_old
 
-    def scrape_jobs(self, term: str, location: str = "Brasil", max_scrolls: int = 50, max_days_old: int = 3) -> List[Dict]:
-        self.driver = self._setup_driver()
+    def _collect_cards_current_page(self, cutoff_date: datetime) -> List[Dict]:
+        # Fecha overlays uma vez e extrai os campos de todos os cards no navegador, numa única chamada
+        self._dismiss_login_overlays(quick_timeout=0.05, attempts=2)
+        try:
+            rows = self.driver.execute_script(CARD_FIELDS_JS, CARD_SELECTOR) or []
+        except Exception:
+            rows = []
+
+        # (urn, extrator, card): o urn vem pronto do navegador (último campo) ou do HTML via regex
+        if rows:
+            cards = [(row[-1], LinkedInScraper._job_from_fields, tuple(row)) for row in rows if row]
+        else:
+            html = self.driver.page_source
+            cards, _ = self._cards_from_html(
+                (etree.tostring(li, encoding='unicode', with_tail=False) for li in CARD_XPATH(lxml_html.fromstring(html))),
+                cutoff_date,
+            )
+            print(f"   • fallback page_source -> {len(cards)} cards (lxml)")
+
+        return self._filter_cards(cards, cutoff_date)[0]
+
+    def scrape_jobs(self, term: str, location: str = "Brasil", max_scrolls: int = 50, max_days_old: int = 3,
+                    max_pages: int = 10) -> List[Dict]:
+        """
+        Busca as vagas de um termo. Com httpx instalado, a listagem vem do endpoint
+        guest por HTTP (até max_pages páginas) e o Chrome nem é aberto; se o endpoint
+        bloquear, completa com o Selenium e scroll infinito (até max_scrolls). Sem open()
+        (ou bloco `with`), o Chrome usado é fechado ao final.
+        """
+        cutoff_date = datetime.now() - timedelta(days=max_days_old)
+        if not self.keep_driver:
+            self._seen_urns.clear()  # sem sessão aberta, cada chamada é independente
         results: List[Dict] = []
+        if self.guest_available is not False:
+            print(f"\n🔎 {term}: buscando via endpoint guest (HTTP)")
+            if self._scrape_guest(term, location, max_pages, cutoff_date, results):
+                print(f"🧾 Total coletado: {len(results)} vagas válidas")
+                return results
+
+        if self.driver is None:
+            self.driver = self._setup_driver()
         try:
-            cutoff_date = datetime.now() - timedelta(days=max_days_old)
-            
             # URL única sem paginação - LinkedIn usa scroll infinito
             url = self._build_search_url(term, location=location, start=0)
             print(f"\n🔎 Acessando: {url}")
@@ -431,8 +728,23 @@ class LinkedInScraper:
 
             return results
         finally:
-            if self.driver:
-                self.driver.quit()
+            if not self.keep_driver:
+                self.close()
+
+
+@lru_cache(maxsize=1024)
+def _card_fields_cached(card_html: str) -> Optional[Tuple]:
+    """
+    Memoiza só o parse por HTML do card (tupla imutável de campos brutos). A vaga,
+    com a data relativa ("há 2 dias"), é montada de novo a cada chamada, para não
+    envelhecer no cache entre execuções do mesmo processo (bot do Discord).
+    """
+    return LinkedInScraper._read_card_fields(card_html)
+
+
+def _job_from_card_html(card_html: str) -> Optional[Dict]:
+    fields = _card_fields_cached(card_html)
+    return LinkedInScraper._job_from_fields(fields) if fields is not None else None
 
 
 def load_keywords(filename: str = 'keywords.json') -> List[str]:
@@ -454,20 +766,33 @@ def deduplicate_jobs(jobs: List[Dict]) -> List[Dict]:
     return out
 
 
+def write_json(filename: str, data) -> None:
+    """Grava JSON indentado em UTF-8 (acentos sem escape), via orjson quando disponível."""
+    if _USE_ORJSON:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def main():
+    # Resumos por página saem no console (INFO); mensagens por vaga só com o nível DEBUG
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    logging.getLogger('httpx').setLevel(logging.WARNING)  # sem uma linha por requisição
     keywords = load_keywords('keywords.json')
     print(f"🚀 LinkedIn: iniciando scraping com {len(keywords)} keywords...")
     print(f"📋 Keywords: {keywords}")
     
     all_jobs: List[Dict] = []
-    scraper = LinkedInScraper(headless=True)  # modo headless ativado
-    
-    for i, kw in enumerate(keywords, 1):
-        qkw = LinkedInScraper._ensure_quoted(kw)
-        print(f"\n🔍 ({i}/{len(keywords)}) Buscando por: {qkw}")
-        jobs = scraper.scrape_jobs(term=kw, location='Brasil', max_scrolls=50, max_days_old=3)
-        print(f"✅ Encontradas {len(jobs)} vagas para '{kw}'")
-        all_jobs.extend(jobs)
+    # modo headless ativado; um único Chrome para todas as keywords
+    with LinkedInScraper(headless=True) as scraper:
+        for i, kw in enumerate(keywords, 1):
+            qkw = LinkedInScraper._ensure_quoted(kw)
+            print(f"\n🔍 ({i}/{len(keywords)}) Buscando por: {qkw}")
+            jobs = scraper.scrape_jobs(term=kw, location='Brasil', max_scrolls=50, max_days_old=3)
+            print(f"✅ Encontradas {len(jobs)} vagas para '{kw}'")
+            all_jobs.extend(jobs)
     
     # Deduplicação e salvamento
     unique_jobs = deduplicate_jobs(all_jobs)
@@ -477,8 +802,7 @@ def main():
     
     # Salva em JSON
     output_file = 'vagas_linkedin.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(unique_jobs, f, ensure_ascii=False, indent=2)
+    write_json(output_file, unique_jobs)
     
     print(f"💾 Salvo em: {output_file}")
     print(f"✅ LinkedIn scraping concluído!")
@@ -5,12 +5,14 @@ Orquestrador principal dos scrapers de vagas.
 Executa Gupy → Indeed → LinkedIn em sequência com modo headless.
 """
 
-import json
+import logging
+import sys
 import time
 from datetime import datetime
+from itertools import chain
 from typing import List, Dict
 
-from gupy_scraper import GupyScraper, load_keywords, deduplicate_jobs
+from gupy_scraper import GupyScraper, load_keywords, deduplicate_jobs, scrape_keywords, write_json
 from indeed_scraper import IndeedScraper
 from linkedin_scraper import LinkedInScraper
 
@@ -18,8 +20,10 @@ from linkedin_scraper import LinkedInScraper
 class MainScraper:
     """Orquestrador principal que executa todos os scrapers em sequência."""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, workers: int = 1):
         self.headless = headless
+        # Keywords em paralelo por fonte, cada worker com o seu Chrome (até gupy_scraper.MAX_WORKERS_PER_SOURCE); 1 = sequencial
+        self.workers = workers
         self.results = {
             'gupy': [],
             'indeed': [],
@@ -32,21 +36,16 @@ class MainScraper:
         print("🚀 Iniciando Gupy Scraper...")
         start_time = datetime.now()
         
-        scraper = GupyScraper(headless=self.headless)
-        all_jobs = []
-        
-        for i, keyword in enumerate(keywords, 1):
-            print(f"\n🔍 Gupy ({i}/{len(keywords)}): Buscando '{keyword}'...")
-            jobs = scraper.scrape_jobs(
-                term=keyword,
-                remote_only=True,
-                max_pages=5,
-                max_days_old=3
-            )
-            print(f"✅ Gupy '{keyword}': {len(jobs)} vagas encontradas")
-            all_jobs.extend(jobs)
-        
-        unique_jobs = deduplicate_jobs(all_jobs)
+        unique_jobs = scrape_keywords(
+            keywords,
+            max_workers=self.workers,
+            scraper_factory=lambda: GupyScraper(headless=self.headless),
+            label='Gupy',
+            remote_only=True,
+            max_pages=5,
+            max_days_old=3,
+        )
+        
         self.results['gupy'] = unique_jobs
         self.timestamps['gupy'] = {
             'start': start_time.isoformat(),
@@ -62,19 +61,14 @@ class MainScraper:
         print("\n🚀 Iniciando Indeed Scraper...")
         start_time = datetime.now()
         
-        scraper = IndeedScraper(headless=self.headless)
-        all_jobs = []
-        
-        for i, keyword in enumerate(keywords, 1):
-            print(f"\n🔍 Indeed ({i}/{len(keywords)}): Buscando '{keyword}'...")
-            jobs = scraper.scrape_jobs(
-                term=keyword,
-                max_pages=5
-            )
-            print(f"✅ Indeed '{keyword}': {len(jobs)} vagas encontradas")
-            all_jobs.extend(jobs)
+        unique_jobs = scrape_keywords(
+            keywords,
+            max_workers=self.workers,
+            scraper_factory=lambda: IndeedScraper(headless=self.headless),
+            label='Indeed',
+            max_pages=5,
+        )
         
-        unique_jobs = deduplicate_jobs(all_jobs)
         self.results['indeed'] = unique_jobs
         self.timestamps['indeed'] = {
             'start': start_time.isoformat(),
@@ -90,21 +84,16 @@ class MainScraper:
         print("\n🚀 Iniciando LinkedIn Scraper...")
         start_time = datetime.now()
         
-        scraper = LinkedInScraper(headless=self.headless)
-        all_jobs = []
-        
-        for i, keyword in enumerate(keywords, 1):
-            print(f"\n🔍 LinkedIn ({i}/{len(keywords)}): Buscando '{keyword}'...")
-            jobs = scraper.scrape_jobs(
-                term=keyword,
-                location='Brasil',
-                max_scrolls=50,
-                max_days_old=3
-            )
-            print(f"✅ LinkedIn '{keyword}': {len(jobs)} vagas encontradas")
-            all_jobs.extend(jobs)
-        
-        unique_jobs = deduplicate_jobs(all_jobs)
+        unique_jobs = scrape_keywords(
+            keywords,
+            max_workers=self.workers,
+            scraper_factory=lambda: LinkedInScraper(headless=self.headless),
+            label='LinkedIn',
+            location='Brasil',
+            max_scrolls=50,
+            max_days_old=3,
+        )
+        
         self.results['linkedin'] = unique_jobs
         self.timestamps['linkedin'] = {
             'start': start_time.isoformat(),
@@ -115,25 +104,19 @@ class MainScraper:
         print(f"✅ LinkedIn concluído: {len(unique_jobs)} vagas únicas")
         return unique_jobs
     
-    def save_results(self):
-        """Salva os resultados de cada plataforma em arquivos separados."""
+    def save_results(self) -> List[Dict]:
+        """Salva os resultados de cada plataforma em arquivos separados e retorna o consolidado."""
         print("\n💾 Salvando resultados...")
         
         # Salva resultados individuais
         for platform, jobs in self.results.items():
             filename = f'vagas_{platform}.json'
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
+            write_json(filename, jobs)
             print(f"📄 {filename}: {len(jobs)} vagas salvas")
         
-        # Salva resultados consolidados
-        all_jobs = []
-        for jobs in self.results.values():
-            all_jobs.extend(jobs)
-        
-        consolidated_jobs = deduplicate_jobs(all_jobs)
-        with open('vagas_consolidadas.json', 'w', encoding='utf-8') as f:
-            json.dump(consolidated_jobs, f, ensure_ascii=False, indent=2)
+        # Salva resultados consolidados (deduplica direto das listas, sem concatená-las)
+        consolidated_jobs = deduplicate_jobs(chain.from_iterable(self.results.values()))
+        write_json('vagas_consolidadas.json', consolidated_jobs)
         
         # Salva relatório de execução
         report = {
@@ -148,11 +131,11 @@ class MainScraper:
             }
         }
         
-        with open('relatorio_execucao.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        write_json('relatorio_execucao.json', report)
         
         print(f"📊 Relatório salvo: relatorio_execucao.json")
         print(f"🔄 Consolidado: vagas_consolidadas.json ({len(consolidated_jobs)} vagas únicas)")
+        return consolidated_jobs
     
     def run_all_scrapers(self, keywords: List[str]):
         """Executa todos os scrapers na sequência: Gupy → Indeed → LinkedIn."""
@@ -177,12 +160,11 @@ class MainScraper:
             print("\n🎯 FASE 3: LINKEDIN")
             self.run_linkedin_scraper(keywords)
             
-            # Salva todos os resultados
-            self.save_results()
+            # Salva todos os resultados (o consolidado é deduplicado uma única vez)
+            consolidated_jobs = self.save_results()
             
             # Relatório final
             total_duration = (datetime.now() - total_start).total_seconds()
-            total_jobs = sum(len(jobs) for jobs in self.results.values())
             
             print("\n" + "=" * 60)
             print("✅ SCRAPING CONCLUÍDO COM SUCESSO!")
@@ -191,7 +173,7 @@ class MainScraper:
             print(f"📊 Total de vagas coletadas:")
             for platform, jobs in self.results.items():
                 print(f"   • {platform.upper()}: {len(jobs)} vagas")
-            print(f"🔄 Total consolidado: {len(deduplicate_jobs([job for jobs in self.results.values() for job in jobs]))} vagas únicas")
+            print(f"🔄 Total consolidado: {len(consolidated_jobs)} vagas únicas")
             print("=" * 60)
             
         except Exception as e:
@@ -203,6 +185,9 @@ class MainScraper:
 
 def main():
     """Função principal do orquestrador."""
+    # Resumos por página dos scrapers saem no console (INFO); mensagens por vaga só com o nível DEBUG
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    logging.getLogger('httpx').setLevel(logging.WARNING)  # sem uma linha por requisição
     # Carrega keywords do arquivo
     keywords = load_keywords('keywords.json')
     
@@ -211,7 +196,7 @@ def main():
         return
     
     # Cria e executa o orquestrador
-    scraper = MainScraper(headless=True)  # Modo headless ativado
+    scraper = MainScraper(headless=True, workers=3)  # Modo headless, 3 keywords em paralelo por fonte
     scraper.run_all_scrapers(keywords)
 
 